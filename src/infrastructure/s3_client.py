@@ -1,9 +1,12 @@
+import json
 from typing import Any, Dict
+
 import boto3
 from botocore.client import Config
 from botocore.exceptions import ClientError
 from pydantic import BaseModel, Field
 
+from services.shared import fast_json
 from services.shared.models.s3_models import (
     S3Config,
     RevisionMetadata,
@@ -49,7 +52,6 @@ class S3Client(BaseModel):
             raise
     
     def write_revision(self, entity_id: str, revision_id: int, data: dict, publication_state: str = "pending") -> RevisionMetadata:
-        import json
         key = f"{entity_id}/r{revision_id}.json"
         self.client.put_object(
             Bucket=self.config.bucket,
@@ -61,12 +63,10 @@ class S3Client(BaseModel):
     
     def read_revision(self, entity_id: str, revision_id: int) -> RevisionReadResponse:
         """Read S3 object and return parsed JSON"""
-        import json
-        
         key = f"{entity_id}/r{revision_id}.json"
         response = self.client.get_object(Bucket=self.config.bucket, Key=key)
         
-        parsed_data = json.loads(response["Body"].read().decode("utf-8"))
+        parsed_data = fast_json.loads(response["Body"].read())
         
         return RevisionReadResponse(
             entity_id=entity_id,
@@ -86,11 +86,9 @@ class S3Client(BaseModel):
     
     def read_full_revision(self, entity_id: str, revision_id: int) -> Dict[str, Any]:
         """Read S3 object and return parsed full revision JSON"""
-        import json
-        
         key = f"{entity_id}/r{revision_id}.json"
         response = self.client.get_object(Bucket=self.config.bucket, Key=key)
         
-        parsed_data = json.loads(response["Body"].read().decode("utf-8"))
+        parsed_data = fast_json.loads(response["Body"].read())
         
         return parsed_data
@@ -0,0 +1,17 @@
+"""JSON decoding shared by the parsers, the S3 client and the tests, using orjson with a stdlib json fallback"""
+import json
+from types import ModuleType
+from typing import Any
+
+orjson: ModuleType | None
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def loads(data: bytes) -> Any:
+    """Parse JSON straight from bytes, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
@@ -22,6 +22,7 @@ from .values import (
 from .qualifiers import Qualifier
 from .references import Reference, ReferenceValue
 from .statements import Statement
+from .sitelinks import SitelinksTable
 from .entity import Entity
 
 __all__ = [
@@ -48,5 +49,6 @@ __all__ = [
     "Reference",
     "ReferenceValue",
     "Statement",
+    "SitelinksTable",
     "Entity",
 ]
@@ -3,10 +3,12 @@ from enum import Enum
 
 class Datatype(str, Enum):
     WIKIBASE_ITEM = "wikibase-item"
+    WIKIBASE_PROPERTY = "wikibase-property"
     STRING = "string"
     TIME = "time"
     QUANTITY = "quantity"
     GLOBOCOORDINATE = "globecoordinate"
+    GLOBE_COORDINATE = "globe-coordinate"
     MONOLINGUALTEXT = "monolingualtext"
     EXTERNAL_ID = "external-id"
     COMMONS_MEDIA = "commonsMedia"
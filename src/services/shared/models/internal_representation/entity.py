@@ -1,11 +1,17 @@
-from typing import Optional, Any
+from functools import cached_property
+from typing import Any, Mapping, Optional, Self
 
 from pydantic import BaseModel, ConfigDict
 
 from services.shared.models.internal_representation.entity_types import EntityKind
+from services.shared.models.internal_representation.ranks import Rank
+from services.shared.models.internal_representation.sitelinks import SitelinksTable
 from services.shared.models.internal_representation.statements import Statement
 
 
+CACHED_INDEXES = ("statements_by_property", "rank_set", "references_by_property")
+
+
 class Entity(BaseModel):
     id: str
     type: EntityKind
@@ -13,6 +19,36 @@ class Entity(BaseModel):
     descriptions: dict[str, str]
     aliases: dict[str, list[str]]
     statements: list[Statement]
-    sitelinks: Optional[dict[str, dict[str, Any]]] = None
+    sitelinks: Optional[SitelinksTable] = None
 
     model_config = ConfigDict(frozen=True)
+
+    @cached_property
+    def statements_by_property(self) -> dict[str, list[Statement]]:
+        """Statements grouped by property id, built on first access"""
+        statements_by_property: dict[str, list[Statement]] = {}
+        for statement in self.statements:
+            statements_by_property.setdefault(statement.property, []).append(statement)
+        return statements_by_property
+
+    @cached_property
+    def rank_set(self) -> frozenset[Rank]:
+        """Distinct ranks used by the statements, built on first access"""
+        return frozenset(statement.rank for statement in self.statements)
+
+    @cached_property
+    def references_by_property(self) -> dict[str, list[tuple[int, int]]]:
+        """(statement index, reference index) pairs for each property cited in a reference, built on first access"""
+        references_by_property: dict[str, list[tuple[int, int]]] = {}
+        for statement_index, statement in enumerate(self.statements):
+            for reference_index, reference in enumerate(statement.references):
+                for reference_property in dict.fromkeys(reference.properties):
+                    references_by_property.setdefault(reference_property, []).append((statement_index, reference_index))
+        return references_by_property
+
+    def model_copy(self, *, update: Mapping[str, Any] | None = None, deep: bool = False) -> Self:
+        """Copy the entity without the cached indexes, which may not match the copied statements"""
+        copied = super().model_copy(update=update, deep=deep)
+        for name in CACHED_INDEXES:
+            copied.__dict__.pop(name, None)
+        return copied
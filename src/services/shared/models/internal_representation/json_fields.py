@@ -1,4 +1,6 @@
 from enum import Enum
+from types import MappingProxyType
+from typing import Any
 
 
 class JsonField(str, Enum):
@@ -40,3 +42,53 @@ class JsonField(str, Enum):
     ENTITY_TYPE = "entity-type"
     NUMERIC_ID = "numeric-id"
     ENTITIES = "entities"
+    SITE = "site"
+    TITLE = "title"
+    BADGES = "badges"
+    URL = "url"
+    SITES = "sites"
+    TITLES = "titles"
+    URLS = "urls"
+
+
+# Plain str keys for hot parser paths, avoiding the enum attribute lookup per access
+ID_KEY = JsonField.ID.value
+TYPE_KEY = JsonField.TYPE.value
+LABELS_KEY = JsonField.LABELS.value
+DESCRIPTIONS_KEY = JsonField.DESCRIPTIONS.value
+ALIASES_KEY = JsonField.ALIASES.value
+CLAIMS_KEY = JsonField.CLAIMS.value
+SITELINKS_KEY = JsonField.SITELINKS.value
+MAINSNAK_KEY = JsonField.MAINSNAK.value
+QUALIFIERS_KEY = JsonField.QUALIFIERS.value
+REFERENCES_KEY = JsonField.REFERENCES.value
+RANK_KEY = JsonField.RANK.value
+STATEMENT_ID_KEY = JsonField.STATEMENT_ID.value
+SNAKTYPE_KEY = JsonField.SNAKTYPE.value
+PROPERTY_KEY = JsonField.PROPERTY.value
+DATAVALUE_KEY = JsonField.DATAVALUE.value
+DATATYPE_KEY = JsonField.DATATYPE.value
+VALUE_KEY = JsonField.VALUE.value
+TIME_KEY = JsonField.TIME.value
+TIMEZONE_KEY = JsonField.TIMEZONE.value
+BEFORE_KEY = JsonField.BEFORE.value
+AFTER_KEY = JsonField.AFTER.value
+PRECISION_KEY = JsonField.PRECISION.value
+CALENDARMODEL_KEY = JsonField.CALENDARMODEL.value
+AMOUNT_KEY = JsonField.AMOUNT.value
+UNIT_KEY = JsonField.UNIT.value
+UPPER_BOUND_KEY = JsonField.UPPER_BOUND.value
+LOWER_BOUND_KEY = JsonField.LOWER_BOUND.value
+LATITUDE_KEY = JsonField.LATITUDE.value
+LONGITUDE_KEY = JsonField.LONGITUDE.value
+ALTITUDE_KEY = JsonField.ALTITUDE.value
+GLOBE_KEY = JsonField.GLOBE.value
+LANGUAGE_KEY = JsonField.LANGUAGE.value
+TEXT_KEY = JsonField.TEXT.value
+HASH_KEY = JsonField.HASH.value
+SNAKS_KEY = JsonField.SNAKS.value
+TITLE_KEY = JsonField.TITLE.value
+BADGES_KEY = JsonField.BADGES.value
+URL_KEY = JsonField.URL.value
+
+EMPTY_VALUE: MappingProxyType[str, Any] = MappingProxyType({})
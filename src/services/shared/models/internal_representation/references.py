@@ -1,4 +1,8 @@
-from pydantic import BaseModel, ConfigDict
+from functools import cached_property
+from typing import Any, Mapping, Self
+
+from pydantic import BaseModel, ConfigDict, model_serializer, model_validator
+from services.shared.models.internal_representation.json_fields import JsonField
 from services.shared.models.internal_representation.values import Value
 
 
@@ -11,6 +15,35 @@ class ReferenceValue(BaseModel):
 
 class Reference(BaseModel):
     hash: str
-    snaks: list[ReferenceValue]
+    properties: tuple[str, ...]
+    values: tuple[Value, ...]
 
     model_config = ConfigDict(frozen=True)
+
+    @model_validator(mode="before")
+    @classmethod
+    def from_snaks(cls, data: Any) -> Any:
+        """Accept the hash plus snaks list of (property, value) pairs"""
+        if not isinstance(data, Mapping) or JsonField.SNAKS.value not in data:
+            return data
+        snaks = [ReferenceValue.model_validate(snak) for snak in data[JsonField.SNAKS.value]]
+        return {
+            JsonField.HASH.value: data.get(JsonField.HASH.value),
+            "properties": tuple(snak.property for snak in snaks),
+            "values": tuple(snak.value for snak in snaks),
+        }
+
+    @model_serializer
+    def to_snaks(self) -> dict[str, Any]:
+        """Serialize as the hash plus snaks list of (property, value) pairs"""
+        return {JsonField.HASH.value: self.hash, JsonField.SNAKS.value: self.snaks}
+
+    @cached_property
+    def snaks(self) -> list[ReferenceValue]:
+        return [ReferenceValue(property=property_id, value=value) for property_id, value in zip(self.properties, self.values)]
+
+    def model_copy(self, *, update: Mapping[str, Any] | None = None, deep: bool = False) -> Self:
+        """Copy the reference without the cached snaks, which may not match the copied tuples"""
+        copied = super().model_copy(update=update, deep=deep)
+        copied.__dict__.pop("snaks", None)
+        return copied
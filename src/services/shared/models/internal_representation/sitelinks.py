@@ -0,0 +1,89 @@
+from collections.abc import Mapping
+from typing import Any, Iterator, Optional, Self
+
+from pydantic import BaseModel, ConfigDict, PrivateAttr, model_serializer, model_validator
+
+from services.shared.models.internal_representation.json_fields import JsonField
+
+
+class SitelinksTable(BaseModel):
+    sites: list[str]
+    titles: list[str]
+    badges: list[list[str]]
+    urls: list[Optional[str]]
+
+    model_config = ConfigDict(frozen=True)
+
+    _index: dict[str, int] = PrivateAttr(default_factory=dict)
+
+    @model_validator(mode="before")
+    @classmethod
+    def from_sitelinks_json(cls, data: Any) -> Any:
+        """Accept the site-keyed sitelinks dict used in entity JSON"""
+        if not isinstance(data, Mapping) or JsonField.SITES.value in data:
+            return data
+        return {
+            JsonField.SITES.value: list(data),
+            JsonField.TITLES.value: [sitelink.get(JsonField.TITLE.value, "") for sitelink in data.values()],
+            JsonField.BADGES.value: [sitelink.get(JsonField.BADGES.value, []) for sitelink in data.values()],
+            JsonField.URLS.value: [sitelink.get(JsonField.URL.value) for sitelink in data.values()],
+        }
+
+    def model_post_init(self, _context: Any) -> None:
+        self._index = {site: i for i, site in enumerate(self.sites)}
+
+    def model_copy(self, *, update: Mapping[str, Any] | None = None, deep: bool = False) -> Self:
+        """Copy the table and rebuild the site index, which may not match the copied sites"""
+        copied = super().model_copy(update=update, deep=deep)
+        copied.model_post_init(None)
+        return copied
+
+    @model_serializer
+    def to_sitelinks_json(self) -> dict[str, dict[str, Any]]:
+        """Serialize back to the site-keyed sitelinks dict used in entity JSON"""
+        return dict(self.items())
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, SitelinksTable):
+            return super().__eq__(other)
+        if isinstance(other, Mapping):
+            return dict(self.items()) == dict(other.items())
+        return NotImplemented
+
+    def __contains__(self, site: object) -> bool:
+        return site in self._index
+
+    def __len__(self) -> int:
+        return len(self.sites)
+
+    def __iter__(self) -> Iterator[str]:  # type: ignore[override]
+        return iter(self.sites)
+
+    def __getitem__(self, site: str) -> dict[str, Any]:
+        i = self._index[site]
+        sitelink: dict[str, Any] = {
+            JsonField.SITE.value: site,
+            JsonField.TITLE.value: self.titles[i],
+            JsonField.BADGES.value: self.badges[i],
+        }
+        url = self.urls[i]
+        if url is not None:
+            sitelink[JsonField.URL.value] = url
+        return sitelink
+
+    def get(self, site: str, default: Optional[dict[str, Any]] = None) -> Optional[dict[str, Any]]:
+        if site not in self._index:
+            return default
+        return self[site]
+
+    def keys(self) -> list[str]:
+        return list(self.sites)
+
+    def values(self) -> list[dict[str, Any]]:
+        return [self[site] for site in self.sites]
+
+    def items(self) -> list[tuple[str, dict[str, Any]]]:
+        return [(site, self[site]) for site in self.sites]
+
+
+Mapping.register(SitelinksTable)
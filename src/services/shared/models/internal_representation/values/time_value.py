@@ -5,6 +5,9 @@ from typing_extensions import Literal
 from .base import Value
 
 
+TIME_PATTERN = re.compile(r'^[+-][0-9]{1,16}-(?:1[0-2]|0[0-9])-(?:3[01]|0[0-9]|[12][0-9])T(?:2[0-3]|[01][0-9]):[0-5][0-9]:[0-5][0-9]Z$')
+
+
 class TimeValue(Value):
     kind: Literal["time"] = Field(default="time", frozen=True)
     value: str
@@ -23,8 +26,7 @@ class TimeValue(Value):
         if not (v.startswith("+") or v.startswith("-")):
             v = "+" + v
 
-        pattern = re.compile(r'^[+-][0-9]{1,16}-(?:1[0-2]|0[0-9])-(?:3[01]|0[0-9]|[12][0-9])T(?:2[0-3]|[01][0-9]):[0-5][0-9]:[0-5][0-9]Z$')
-        if not pattern.match(v):
+        if not TIME_PATTERN.match(v):
             raise ValueError(f"Time value must be in format '+%Y-%m-%dT%H:%M:%SZ', got: {v}")
         return v
 
@@ -1,4 +1,10 @@
-from services.shared.parsers.entity_parser import parse_entity
+from services.shared.parsers.entity_parser import (
+    parse_entities_parallel,
+    parse_entity,
+    parse_entity_bytes,
+    parse_entity_cached,
+    parse_entity_dump,
+)
 from services.shared.parsers.qualifier_parser import parse_qualifiers, parse_qualifier
 from services.shared.parsers.reference_parser import parse_references, parse_reference
 from services.shared.parsers.statement_parser import parse_statement
@@ -6,6 +12,10 @@ from services.shared.parsers.value_parser import parse_value
 
 __all__ = [
     "parse_entity",
+    "parse_entity_bytes",
+    "parse_entity_cached",
+    "parse_entity_dump",
+    "parse_entities_parallel",
     "parse_qualifiers",
     "parse_qualifier",
     "parse_references",
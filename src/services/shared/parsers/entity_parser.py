@@ -1,30 +1,57 @@
+import bz2
+import gzip
+import hashlib
 import logging
 
-from typing import Any
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from sys import intern
+from typing import IO, Any, Callable, Iterator
 
+from services.shared import fast_json
 from services.shared.parsers.statement_parser import parse_statement
 from services.shared.models.internal_representation.entity import Entity
+from services.shared.models.internal_representation.statements import Statement
 from services.shared.models.internal_representation.entity_types import EntityKind
-from services.shared.models.internal_representation.json_fields import JsonField
+from services.shared.models.internal_representation.sitelinks import SitelinksTable
+from services.shared.models.internal_representation.json_fields import (
+    ALIASES_KEY,
+    BADGES_KEY,
+    CLAIMS_KEY,
+    DESCRIPTIONS_KEY,
+    ID_KEY,
+    LABELS_KEY,
+    SITELINKS_KEY,
+    TITLE_KEY,
+    TYPE_KEY,
+    URL_KEY,
+)
 
 
 logger = logging.getLogger(__name__)
 
+PARSE_CACHE_SIZE = 1024
 
-def parse_entity(entity_json: dict[str, Any]) -> Entity:
-    entity_id = entity_json.get(JsonField.ID.value, "")
-    entity_type = EntityKind(entity_json.get(JsonField.TYPE.value, EntityKind.ITEM.value))
+DUMP_OPENERS: dict[str, Callable[..., IO[Any]]] = {".bz2": bz2.open, ".gz": gzip.open}
 
-    labels_json = entity_json.get(JsonField.LABELS.value, {})
-    descriptions_json = entity_json.get(JsonField.DESCRIPTIONS.value, {})
-    aliases_json = entity_json.get(JsonField.ALIASES.value, {})
-    claims_json = entity_json.get(JsonField.CLAIMS.value, {})
-    sitelinks_json = entity_json.get(JsonField.SITELINKS.value, {})
+_parsed_entities: OrderedDict[bytes, Entity] = OrderedDict()
+
+
+def parse_entity(entity_json: dict[str, Any], *, fast: bool = False) -> Entity:
+    entity_id = entity_json.get(ID_KEY, "")
+    entity_type = EntityKind(entity_json.get(TYPE_KEY, EntityKind.ITEM.value))
+
+    labels_json = entity_json.get(LABELS_KEY, {})
+    descriptions_json = entity_json.get(DESCRIPTIONS_KEY, {})
+    aliases_json = entity_json.get(ALIASES_KEY, {})
+    claims_json = entity_json.get(CLAIMS_KEY, {})
+    sitelinks_json = entity_json.get(SITELINKS_KEY, {})
 
     labels = _parse_labels(labels_json)
     descriptions = _parse_descriptions(descriptions_json)
     aliases = _parse_aliases(aliases_json)
-    statements = _parse_statements(claims_json)
+    statements = _parse_statements(claims_json, fast=fast)
 
     return Entity(
         id=entity_id,
@@ -33,28 +60,84 @@ def parse_entity(entity_json: dict[str, Any]) -> Entity:
         descriptions=descriptions,
         aliases=aliases,
         statements=statements,
-        sitelinks=sitelinks_json if sitelinks_json else None
+        sitelinks=_parse_sitelinks(sitelinks_json) if sitelinks_json else None
     )
 
 
+def parse_entity_bytes(entity_bytes: bytes, *, fast: bool = False) -> Entity:
+    return parse_entity(fast_json.loads(entity_bytes), fast=fast)
+
+
+def parse_entity_cached(entity_bytes: bytes) -> Entity:
+    """Parse raw entity JSON, reusing the result for recently seen identical content"""
+    content_hash = hashlib.blake2b(entity_bytes, digest_size=16).digest()
+    entity = _parsed_entities.get(content_hash)
+    if entity is not None:
+        _parsed_entities.move_to_end(content_hash)
+        return entity
+
+    entity = parse_entity_bytes(entity_bytes)
+    _parsed_entities[content_hash] = entity
+    if len(_parsed_entities) > PARSE_CACHE_SIZE:
+        _parsed_entities.popitem(last=False)
+    return entity
+
+
+def parse_entity_dump(dump_path: Path) -> Iterator[Entity]:
+    """Yield entities one line at a time from a JSON lines or Wikidata array dump, optionally bz2 or gzip compressed"""
+    opener = DUMP_OPENERS.get(dump_path.suffix, open)
+    with opener(dump_path, "rb") as dump_file:
+        for line in dump_file:
+            line = line.strip().rstrip(b",")
+            if not line or line in (b"[", b"]"):
+                continue
+            yield parse_entity_bytes(line, fast=True)
+
+
+def parse_entities_parallel(entity_paths: list[Path], workers: int | None = None) -> Iterator[Entity]:
+    """Parse flat entity JSON files across worker processes in input order, cancelling queued files if iteration stops early"""
+    executor = ProcessPoolExecutor(max_workers=workers)
+    try:
+        yield from executor.map(_parse_entity_file, entity_paths, chunksize=64)
+    finally:
+        executor.shutdown(cancel_futures=True)
+
+
+def _parse_entity_file(entity_path: Path) -> Entity:
+    return parse_entity_bytes(entity_path.read_bytes())
+
+
 def _parse_labels(labels_json: dict[str, dict[str, str]]) -> dict[str, str]:
-    return {lang: label_data.get("value", "") for lang, label_data in labels_json.items()}
+    return {intern(lang): label_data.get("value", "") for lang, label_data in labels_json.items()}
 
 
 def _parse_descriptions(descriptions_json: dict[str, dict[str, str]]) -> dict[str, str]:
-    return {lang: desc_data.get("value", "") for lang, desc_data in descriptions_json.items()}
+    return {intern(lang): desc_data.get("value", "") for lang, desc_data in descriptions_json.items()}
 
 
 def _parse_aliases(aliases_json: dict[str, list[dict[str, str]]]) -> dict[str, list[str]]:
-    return {lang: [alias_data.get("value", "") for alias_data in alias_list] for lang, alias_list in aliases_json.items()}
+    return {intern(lang): [alias_data.get("value", "") for alias_data in alias_list] for lang, alias_list in aliases_json.items()}
+
+
+def _parse_sitelinks(sitelinks_json: dict[str, dict[str, Any]]) -> SitelinksTable:
+    sites = []
+    titles = []
+    badges = []
+    urls = []
+    for site, sitelink_data in sitelinks_json.items():
+        sites.append(intern(site))
+        titles.append(sitelink_data.get(TITLE_KEY, ""))
+        badges.append(sitelink_data.get(BADGES_KEY, []))
+        urls.append(sitelink_data.get(URL_KEY))
+    return SitelinksTable(sites=sites, titles=titles, badges=badges, urls=urls)
 
 
-def _parse_statements(claims_json: dict[str, list[dict[str, Any]]]) -> list:
-    statements = []
+def _parse_statements(claims_json: dict[str, list[dict[str, Any]]], fast: bool = False) -> list[Statement]:
+    statements: list[Statement] = []
     for property_id, claim_list in claims_json.items():
         for claim_json in claim_list:
             try:
-                statement = parse_statement(claim_json)
+                statement = parse_statement(claim_json, fast=fast)
                 statements.append(statement)
             except ValueError as e:
                 logger.warning(f"Failed to parse statement for property {property_id}: {e}")
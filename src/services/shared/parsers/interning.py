@@ -0,0 +1,9 @@
+from sys import intern
+from typing import Any
+
+
+def intern_str(value: Any) -> Any:
+    """Intern a JSON string, passing any other value through for model validation to reject"""
+    if isinstance(value, str):
+        return intern(value)
+    return value
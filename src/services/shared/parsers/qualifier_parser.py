@@ -1,25 +1,26 @@
 from typing import Any
 
+from services.shared.parsers.interning import intern_str
 from services.shared.parsers.value_parser import parse_value
 from services.shared.models.internal_representation.qualifiers import Qualifier
-from services.shared.models.internal_representation.json_fields import JsonField
+from services.shared.models.internal_representation.json_fields import PROPERTY_KEY
 
 
-def parse_qualifier(qualifier_json: dict[str, Any], property_id: str = "") -> Qualifier:
+def parse_qualifier(qualifier_json: dict[str, Any], property_id: str = "", *, fast: bool = False) -> Qualifier:
     return Qualifier(
-        property=qualifier_json.get(JsonField.PROPERTY.value, property_id),
-        value=parse_value(qualifier_json)
+        property=intern_str(qualifier_json.get(PROPERTY_KEY, property_id)),
+        value=parse_value(qualifier_json, fast=fast)
     )
 
 
-def parse_qualifiers(qualifiers_json: dict[str, list[dict[str, Any]]]) -> list[Qualifier]:
+def parse_qualifiers(qualifiers_json: dict[str, list[dict[str, Any]]], *, fast: bool = False) -> list[Qualifier]:
     qualifiers = []
 
     for property_id, qualifier_list in qualifiers_json.items():
         for qualifier_json in qualifier_list:
             qualifier = Qualifier(
-                property=qualifier_json.get(JsonField.PROPERTY.value, property_id),
-                value=parse_value(qualifier_json)
+                property=intern_str(qualifier_json.get(PROPERTY_KEY, property_id)),
+                value=parse_value(qualifier_json, fast=fast)
             )
             qualifiers.append(qualifier)
 
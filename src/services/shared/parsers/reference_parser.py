@@ -1,48 +1,47 @@
 from typing import Any
 
+from services.shared.parsers.interning import intern_str
 from services.shared.parsers.value_parser import parse_value
-from services.shared.models.internal_representation.references import Reference, ReferenceValue
-from services.shared.models.internal_representation.json_fields import JsonField
+from services.shared.models.internal_representation.references import Reference
+from services.shared.models.internal_representation.json_fields import HASH_KEY, PROPERTY_KEY, SNAKS_KEY
 
 
-def parse_reference(reference_json: dict[str, Any]) -> Reference:
-    reference_hash = reference_json.get(JsonField.HASH.value, "")
-    snaks_json = reference_json.get(JsonField.SNAKS.value, {})
+def parse_reference(reference_json: dict[str, Any], *, fast: bool = False) -> Reference:
+    reference_hash = reference_json.get(HASH_KEY, "")
+    snaks_json = reference_json.get(SNAKS_KEY, {})
 
-    snaks = []
+    properties = []
+    values = []
     for property_id, snak_list in snaks_json.items():
         for snak_json in snak_list:
-            snak = ReferenceValue(
-                property=snak_json.get(JsonField.PROPERTY.value, property_id),
-                value=parse_value(snak_json)
-            )
-            snaks.append(snak)
+            properties.append(intern_str(snak_json.get(PROPERTY_KEY, property_id)))
+            values.append(parse_value(snak_json, fast=fast))
 
     return Reference(
         hash=reference_hash,
-        snaks=snaks
+        properties=tuple(properties),
+        values=tuple(values)
     )
 
 
-def parse_references(references_json: list[dict[str, Any]]) -> list[Reference]:
+def parse_references(references_json: list[dict[str, Any]], *, fast: bool = False) -> list[Reference]:
     references = []
 
     for reference_json in references_json:
-        reference_hash = reference_json.get(JsonField.HASH.value, "")
-        snaks_json = reference_json.get(JsonField.SNAKS.value, {})
+        reference_hash = reference_json.get(HASH_KEY, "")
+        snaks_json = reference_json.get(SNAKS_KEY, {})
 
-        snaks = []
+        properties = []
+        values = []
         for property_id, snak_list in snaks_json.items():
             for snak_json in snak_list:
-                snak = ReferenceValue(
-                    property=snak_json.get(JsonField.PROPERTY.value, property_id),
-                    value=parse_value(snak_json)
-                )
-                snaks.append(snak)
+                properties.append(intern_str(snak_json.get(PROPERTY_KEY, property_id)))
+                values.append(parse_value(snak_json, fast=fast))
 
         reference = Reference(
             hash=reference_hash,
-            snaks=snaks
+            properties=tuple(properties),
+            values=tuple(values)
         )
         references.append(reference)
 
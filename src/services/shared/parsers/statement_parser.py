@@ -1,25 +1,36 @@
 from typing import Any
 
+from services.shared.parsers.interning import intern_str
 from services.shared.parsers.value_parser import parse_value
 from services.shared.parsers.qualifier_parser import parse_qualifiers
 from services.shared.parsers.reference_parser import parse_references
 from services.shared.models.internal_representation.statements import Statement
 from services.shared.models.internal_representation.ranks import Rank
-from services.shared.models.internal_representation.json_fields import JsonField
+from services.shared.models.internal_representation.json_fields import (
+    MAINSNAK_KEY,
+    PROPERTY_KEY,
+    QUALIFIERS_KEY,
+    RANK_KEY,
+    REFERENCES_KEY,
+    STATEMENT_ID_KEY,
+)
 
 
-def parse_statement(statement_json: dict[str, Any]) -> Statement:
-    mainsnak = statement_json.get(JsonField.MAINSNAK.value, {})
-    rank = Rank(statement_json.get(JsonField.RANK.value, Rank.NORMAL.value))
-    qualifiers_json = statement_json.get(JsonField.QUALIFIERS.value, {})
-    references_json = statement_json.get(JsonField.REFERENCES.value, [])
-    statement_id = statement_json.get(JsonField.STATEMENT_ID.value, "")
+DEFAULT_RANK = Rank.NORMAL.value
+
+
+def parse_statement(statement_json: dict[str, Any], *, fast: bool = False) -> Statement:
+    mainsnak = statement_json.get(MAINSNAK_KEY, {})
+    rank = Rank(statement_json.get(RANK_KEY, DEFAULT_RANK))
+    qualifiers_json = statement_json.get(QUALIFIERS_KEY, {})
+    references_json = statement_json.get(REFERENCES_KEY, [])
+    statement_id = statement_json.get(STATEMENT_ID_KEY, "")
 
     return Statement(
-        property=mainsnak.get(JsonField.PROPERTY.value, ""),
-        value=parse_value(mainsnak),
+        property=intern_str(mainsnak.get(PROPERTY_KEY, "")),
+        value=parse_value(mainsnak, fast=fast),
         rank=rank,
-        qualifiers=parse_qualifiers(qualifiers_json),
-        references=parse_references(references_json),
+        qualifiers=parse_qualifiers(qualifiers_json, fast=fast),
+        references=parse_references(references_json, fast=fast),
         statement_id=statement_id
     )
@@ -1,4 +1,4 @@
-from typing import Any
+from typing import Any, Callable
 
 from .values.entity_value_parser import parse_entity_value
 from .values.string_value_parser import parse_string_value
@@ -16,16 +16,26 @@ from .values.math_value_parser import parse_math_value
 from .values.entity_schema_value_parser import parse_entity_schema_value
 from .values.novalue_value_parser import parse_novalue_value
 from .values.somevalue_value_parser import parse_somevalue_value
+from services.shared.models.internal_representation.values import Value
 from services.shared.models.internal_representation.datatypes import Datatype
-from services.shared.models.internal_representation.json_fields import JsonField
+from services.shared.models.internal_representation.json_fields import (
+    DATATYPE_KEY,
+    DATAVALUE_KEY,
+    JsonField,
+    SNAKTYPE_KEY,
+    VALUE_KEY,
+)
 
 
-PARSERS = {
+PARSERS: dict[str, Callable[[dict[str, Any]], Value]] = {
     "wikibase-entityid": parse_entity_value,
+    Datatype.WIKIBASE_ITEM.value: parse_entity_value,
+    Datatype.WIKIBASE_PROPERTY.value: parse_entity_value,
     Datatype.STRING.value: parse_string_value,
     "time": parse_time_value,
     "quantity": parse_quantity_value,
     "globecoordinate": parse_globe_value,
+    Datatype.GLOBE_COORDINATE.value: parse_globe_value,
     "monolingualtext": parse_monolingual_value,
     Datatype.EXTERNAL_ID.value: parse_external_id_value,
     Datatype.COMMONS_MEDIA.value: parse_commons_media_value,
@@ -38,23 +48,56 @@ PARSERS = {
 }
 
 
-def parse_value(snak_json: dict[str, Any]):
-    snaktype = snak_json.get(JsonField.SNAKTYPE.value)
-    
-    if snaktype == "novalue":
-        return parse_novalue_value()
-    
-    if snaktype == "somevalue":
-        return parse_somevalue_value()
-    
-    if snaktype != JsonField.VALUE.value:
+VALUE_SNAKTYPE = JsonField.VALUE.value
+
+VALUE_INTERNER_SIZE = 65536
+
+_value_interner: dict[tuple[Callable[[dict[str, Any]], Value], Any], Value] = {}
+
+
+def parse_value(snak_json: dict[str, Any], *, fast: bool = False) -> Value:
+    """Parse a snak into a Value; fast=True assumes well-formed dump input and skips shape checks"""
+    if fast:
+        try:
+            if snak_json[SNAKTYPE_KEY] == VALUE_SNAKTYPE:
+                fast_datatype: str = snak_json[DATATYPE_KEY]
+                return _intern_value(PARSERS[fast_datatype], snak_json[DATAVALUE_KEY])
+        except KeyError:
+            pass
+
+    snaktype = snak_json.get(SNAKTYPE_KEY)
+
+    if snaktype != VALUE_SNAKTYPE:
+        if snaktype == "novalue":
+            return parse_novalue_value()
+        if snaktype == "somevalue":
+            return parse_somevalue_value()
         raise ValueError(f"Only value snaks are supported, got snaktype: {snaktype}")
 
-    datavalue = snak_json.get(JsonField.DATAVALUE.value, {})
-    datatype = snak_json.get(JsonField.DATATYPE.value)
-    datavalue_type = datavalue.get("type", datatype)
+    datavalue: dict[str, Any] = snak_json.get(DATAVALUE_KEY, {})
+    datatype: str = snak_json.get(DATATYPE_KEY, "")
+
+    parser = PARSERS.get(datatype)
+    if parser is None:
+        datavalue_type: str = datavalue.get("type", datatype)
+        parser = PARSERS.get(datavalue_type)
+        if parser is None:
+            raise ValueError(f"Unsupported value type: {datavalue_type}, datatype: {datatype}")
+    return _intern_value(parser, datavalue)
+
+
+def _intern_value(parser: Callable[[dict[str, Any]], Value], datavalue: dict[str, Any]) -> Value:
+    """Return the Value the same parser already built from an identical datavalue, parsing it only on a miss"""
+    raw_value = datavalue.get(VALUE_KEY)
+    key = (parser, tuple(raw_value.items()) if isinstance(raw_value, dict) else raw_value)
+    try:
+        value = _value_interner.get(key)
+    except TypeError:
+        return parser(datavalue)
 
-    parser = PARSERS.get(str(datatype)) or PARSERS.get(str(datavalue_type))
-    if not parser:
-        raise ValueError(f"Unsupported value type: {datavalue_type}, datatype: {datatype}")
-    return parser(datavalue)
+    if value is None:
+        value = parser(datavalue)
+        if len(_value_interner) >= VALUE_INTERNER_SIZE:
+            _value_interner.clear()
+        _value_interner[key] = value
+    return value
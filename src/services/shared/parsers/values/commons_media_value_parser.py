@@ -1,8 +1,8 @@
 from typing import Any
 
 from services.shared.models.internal_representation.values import CommonsMediaValue
-from services.shared.models.internal_representation.json_fields import JsonField
+from services.shared.models.internal_representation.json_fields import VALUE_KEY
 
 
 def parse_commons_media_value(datavalue: dict[str, Any]) -> CommonsMediaValue:
-    return CommonsMediaValue(value=datavalue.get(JsonField.VALUE.value, ""))
+    return CommonsMediaValue(value=datavalue.get(VALUE_KEY, ""))
@@ -1,8 +1,8 @@
 from typing import Any
 
 from services.shared.models.internal_representation.values import EntitySchemaValue
-from services.shared.models.internal_representation.json_fields import JsonField
+from services.shared.models.internal_representation.json_fields import VALUE_KEY
 
 
 def parse_entity_schema_value(datavalue: dict[str, Any]) -> EntitySchemaValue:
-    return EntitySchemaValue(value=datavalue.get(JsonField.VALUE.value, ""))
+    return EntitySchemaValue(value=datavalue.get(VALUE_KEY, ""))
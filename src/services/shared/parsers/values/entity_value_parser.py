@@ -1,9 +1,9 @@
 from typing import Any
 
+from services.shared.parsers.interning import intern_str
 from services.shared.models.internal_representation.values import EntityValue
-from services.shared.models.internal_representation.json_fields import JsonField
+from services.shared.models.internal_representation.json_fields import EMPTY_VALUE, ID_KEY, VALUE_KEY
 
 
 def parse_entity_value(datavalue: dict[str, Any]) -> EntityValue:
-    entity_id = datavalue.get(JsonField.VALUE.value, {}).get(JsonField.ID.value, "")
-    return EntityValue(value=entity_id)
+    return EntityValue(value=intern_str(datavalue.get(VALUE_KEY, EMPTY_VALUE).get(ID_KEY, "")))
@@ -1,8 +1,8 @@
 from typing import Any
 
 from services.shared.models.internal_representation.values import GeoShapeValue
-from services.shared.models.internal_representation.json_fields import JsonField
+from services.shared.models.internal_representation.json_fields import VALUE_KEY
 
 
 def parse_geo_shape_value(datavalue: dict[str, Any]) -> GeoShapeValue:
-    return GeoShapeValue(value=datavalue.get(JsonField.VALUE.value, ""))
+    return GeoShapeValue(value=datavalue.get(VALUE_KEY, ""))
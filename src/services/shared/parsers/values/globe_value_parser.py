@@ -1,17 +1,41 @@
+from operator import itemgetter
 from typing import Any
 
 from services.shared.models.internal_representation.values import GlobeValue
-from services.shared.models.internal_representation.json_fields import JsonField
+from services.shared.models.internal_representation.json_fields import (
+    ALTITUDE_KEY,
+    EMPTY_VALUE,
+    GLOBE_KEY,
+    LATITUDE_KEY,
+    LONGITUDE_KEY,
+    PRECISION_KEY,
+    VALUE_KEY,
+)
+
+
+_GLOBE_FIELDS = itemgetter(
+    LATITUDE_KEY,
+    LONGITUDE_KEY,
+    PRECISION_KEY,
+    GLOBE_KEY
+)
 
 
 def parse_globe_value(datavalue: dict[str, Any]) -> GlobeValue:
-    globe_data = datavalue.get(JsonField.VALUE.value, {})
-    altitude = globe_data.get(JsonField.ALTITUDE.value)
+    globe_data = datavalue.get(VALUE_KEY, EMPTY_VALUE)
+    try:
+        latitude, longitude, precision, globe = _GLOBE_FIELDS(globe_data)
+    except KeyError:
+        latitude = globe_data.get(LATITUDE_KEY, 0.0)
+        longitude = globe_data.get(LONGITUDE_KEY, 0.0)
+        precision = globe_data.get(PRECISION_KEY, 1 / 3600)
+        globe = globe_data.get(GLOBE_KEY, "http://www.wikidata.org/entity/Q2")
+    altitude = globe_data.get(ALTITUDE_KEY)
     return GlobeValue(
         value="",
-        latitude=float(globe_data.get(JsonField.LATITUDE.value, 0.0)),
-        longitude=float(globe_data.get(JsonField.LONGITUDE.value, 0.0)),
+        latitude=float(latitude),
+        longitude=float(longitude),
         altitude=float(altitude) if altitude is not None else None,
-        precision=float(globe_data.get(JsonField.PRECISION.value, 1 / 3600)),
-        globe=globe_data.get(JsonField.GLOBE.value, "http://www.wikidata.org/entity/Q2")
+        precision=float(precision),
+        globe=globe
     )
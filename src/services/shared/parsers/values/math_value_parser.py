@@ -1,8 +1,8 @@
 from typing import Any
 
 from services.shared.models.internal_representation.values import MathValue
-from services.shared.models.internal_representation.json_fields import JsonField
+from services.shared.models.internal_representation.json_fields import VALUE_KEY
 
 
 def parse_math_value(datavalue: dict[str, Any]) -> MathValue:
-    return MathValue(value=datavalue.get(JsonField.VALUE.value, ""))
+    return MathValue(value=datavalue.get(VALUE_KEY, ""))
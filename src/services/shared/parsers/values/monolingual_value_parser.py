@@ -1,13 +1,14 @@
 from typing import Any
 
+from services.shared.parsers.interning import intern_str
 from services.shared.models.internal_representation.values import MonolingualValue
-from services.shared.models.internal_representation.json_fields import JsonField
+from services.shared.models.internal_representation.json_fields import EMPTY_VALUE, LANGUAGE_KEY, TEXT_KEY, VALUE_KEY
 
 
 def parse_monolingual_value(datavalue: dict[str, Any]) -> MonolingualValue:
-    mono_data = datavalue.get(JsonField.VALUE.value, {})
+    mono_data = datavalue.get(VALUE_KEY, EMPTY_VALUE)
     return MonolingualValue(
         value="",
-        language=mono_data.get(JsonField.LANGUAGE.value, ""),
-        text=mono_data.get(JsonField.TEXT.value, "")
+        language=intern_str(mono_data.get(LANGUAGE_KEY, "")),
+        text=mono_data.get(TEXT_KEY, "")
     )
@@ -1,8 +1,8 @@
 from typing import Any
 
 from services.shared.models.internal_representation.values import MusicalNotationValue
-from services.shared.models.internal_representation.json_fields import JsonField
+from services.shared.models.internal_representation.json_fields import VALUE_KEY
 
 
 def parse_musical_notation_value(datavalue: dict[str, Any]) -> MusicalNotationValue:
-    return MusicalNotationValue(value=datavalue.get(JsonField.VALUE.value, ""))
+    return MusicalNotationValue(value=datavalue.get(VALUE_KEY, ""))
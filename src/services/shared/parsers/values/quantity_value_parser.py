@@ -1,14 +1,23 @@
 from typing import Any
 
 from services.shared.models.internal_representation.values import QuantityValue
-from services.shared.models.internal_representation.json_fields import JsonField
+from services.shared.models.internal_representation.json_fields import (
+    AMOUNT_KEY,
+    EMPTY_VALUE,
+    LOWER_BOUND_KEY,
+    UNIT_KEY,
+    UPPER_BOUND_KEY,
+    VALUE_KEY,
+)
 
 
 def parse_quantity_value(datavalue: dict[str, Any]) -> QuantityValue:
-    quantity_data = datavalue.get(JsonField.VALUE.value, {})
+    quantity_data = datavalue.get(VALUE_KEY, EMPTY_VALUE)
+    upper_bound = quantity_data.get(UPPER_BOUND_KEY)
+    lower_bound = quantity_data.get(LOWER_BOUND_KEY)
     return QuantityValue(
-        value=str(quantity_data.get(JsonField.AMOUNT.value, "0")),
-        unit=quantity_data.get(JsonField.UNIT.value, "1"),
-        upper_bound=str(quantity_data[JsonField.UPPER_BOUND.value]) if JsonField.UPPER_BOUND.value in quantity_data else None,
-        lower_bound=str(quantity_data[JsonField.LOWER_BOUND.value]) if JsonField.LOWER_BOUND.value in quantity_data else None
+        value=str(quantity_data.get(AMOUNT_KEY, "0")),
+        unit=quantity_data.get(UNIT_KEY, "1"),
+        upper_bound=str(upper_bound) if upper_bound is not None else None,
+        lower_bound=str(lower_bound) if lower_bound is not None else None
     )
@@ -1,8 +1,8 @@
 from typing import Any
 
 from services.shared.models.internal_representation.values import StringValue
-from services.shared.models.internal_representation.json_fields import JsonField
+from services.shared.models.internal_representation.json_fields import VALUE_KEY
 
 
 def parse_string_value(datavalue: dict[str, Any]) -> StringValue:
-    return StringValue(value=datavalue.get(JsonField.VALUE.value, ""))
+    return StringValue(value=datavalue.get(VALUE_KEY, ""))
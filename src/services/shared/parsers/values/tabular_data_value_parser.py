@@ -1,8 +1,8 @@
 from typing import Any
 
 from services.shared.models.internal_representation.values import TabularDataValue
-from services.shared.models.internal_representation.json_fields import JsonField
+from services.shared.models.internal_representation.json_fields import VALUE_KEY
 
 
 def parse_tabular_data_value(datavalue: dict[str, Any]) -> TabularDataValue:
-    return TabularDataValue(value=datavalue.get(JsonField.VALUE.value, ""))
+    return TabularDataValue(value=datavalue.get(VALUE_KEY, ""))
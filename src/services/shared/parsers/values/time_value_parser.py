@@ -1,16 +1,45 @@
+from operator import itemgetter
 from typing import Any
 
 from services.shared.models.internal_representation.values import TimeValue
-from services.shared.models.internal_representation.json_fields import JsonField
+from services.shared.models.internal_representation.json_fields import (
+    AFTER_KEY,
+    BEFORE_KEY,
+    CALENDARMODEL_KEY,
+    EMPTY_VALUE,
+    PRECISION_KEY,
+    TIMEZONE_KEY,
+    TIME_KEY,
+    VALUE_KEY,
+)
+
+
+_TIME_FIELDS = itemgetter(
+    TIME_KEY,
+    TIMEZONE_KEY,
+    BEFORE_KEY,
+    AFTER_KEY,
+    PRECISION_KEY,
+    CALENDARMODEL_KEY
+)
 
 
 def parse_time_value(datavalue: dict[str, Any]) -> TimeValue:
-    time_data = datavalue.get(JsonField.VALUE.value, {})
+    time_data = datavalue.get(VALUE_KEY, EMPTY_VALUE)
+    try:
+        time, timezone, before, after, precision, calendarmodel = _TIME_FIELDS(time_data)
+    except KeyError:
+        time = time_data.get(TIME_KEY, "")
+        timezone = time_data.get(TIMEZONE_KEY, 0)
+        before = time_data.get(BEFORE_KEY, 0)
+        after = time_data.get(AFTER_KEY, 0)
+        precision = time_data.get(PRECISION_KEY, 11)
+        calendarmodel = time_data.get(CALENDARMODEL_KEY, "http://www.wikidata.org/entity/Q1985727")
     return TimeValue(
-        value=time_data.get(JsonField.TIME.value, ""),
-        timezone=time_data.get(JsonField.TIMEZONE.value, 0),
-        before=time_data.get(JsonField.BEFORE.value, 0),
-        after=time_data.get(JsonField.AFTER.value, 0),
-        precision=time_data.get(JsonField.PRECISION.value, 11),
-        calendarmodel=time_data.get(JsonField.CALENDARMODEL.value, "http://www.wikidata.org/entity/Q1985727")
+        value=time,
+        timezone=timezone,
+        before=before,
+        after=after,
+        precision=precision,
+        calendarmodel=calendarmodel
     )
@@ -1,8 +1,8 @@
 from typing import Any
 
 from services.shared.models.internal_representation.values import URLValue
-from services.shared.models.internal_representation.json_fields import JsonField
+from services.shared.models.internal_representation.json_fields import VALUE_KEY
 
 
 def parse_url_value(datavalue: dict[str, Any]) -> URLValue:
-    return URLValue(value=datavalue.get(JsonField.VALUE.value, ""))
+    return URLValue(value=datavalue.get(VALUE_KEY, ""))
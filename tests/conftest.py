@@ -1,11 +1,14 @@
 import time
 import logging
 import os
-from typing import Generator
+from typing import TYPE_CHECKING, Generator
 
 import pytest
 import requests
 
+if TYPE_CHECKING:
+    from fastapi.testclient import TestClient
+
 
 @pytest.fixture(scope="session", autouse=True)
 def configure_logging():
@@ -35,6 +38,17 @@ def api_client(base_url: str) -> Generator[requests.Session, None, None]:
     session.close()
 
 
+@pytest.fixture(scope="session")
+def client() -> Generator["TestClient", None, None]:
+    """In-process FastAPI test client, started once per session with the app lifespan"""
+    from fastapi.testclient import TestClient
+
+    from services.entity_api.main import app
+
+    with TestClient(app) as test_client:
+        yield test_client
+
+
 @pytest.fixture(scope="session", autouse=True)
 def wait_for_api(api_client: requests.Session, base_url: str) -> None:
     """Wait for API to become healthy before running tests"""
@@ -58,13 +72,10 @@ def wait_for_api(api_client: requests.Session, base_url: str) -> None:
 
 def log_request(logger: logging.Logger, method: str, url: str, **kwargs) -> requests.Response:
     """Log HTTP request and make the request"""
-    if os.getenv("TEST_LOG_HTTP_REQUESTS") == "true":
+    if os.getenv("TEST_LOG_HTTP_REQUESTS") == "true" and logger.isEnabledFor(logging.DEBUG):
+        logger.debug("  → %s %s", method, url)
         if 'json' in kwargs:
-            body_preview = str(kwargs['json'])[:200]
-            logger.debug(f"  → {method} {url}")
-            logger.debug(f"    Body: {body_preview}...")
-        else:
-            logger.debug(f"  → {method} {url}")
+            logger.debug("    Body: %.200s...", kwargs['json'])
     
     return requests.request(method, url, **kwargs)
 
@@ -77,10 +88,9 @@ def log_response(logger: logging.Logger, response: requests.Response, log_body:
         response: requests.Response object
         log_body: If True, log response body text (default: False)
     """
-    if os.getenv("TEST_LOG_HTTP_REQUESTS") == "true":
+    if os.getenv("TEST_LOG_HTTP_REQUESTS") == "true" and logger.isEnabledFor(logging.DEBUG):
         status_code = response.status_code
         status_emoji = "✓" if status_code < 300 else "✗"
-        logger.debug(f"  ← {status_emoji} {status_code} {response.reason}")
+        logger.debug("  ← %s %s %s", status_emoji, status_code, response.reason)
         if log_body and response.text:
-            text_preview = response.text[:200]
-            logger.debug(f"    Body: {text_preview}...")
+            logger.debug("    Body: %.200s...", response.text)
@@ -1,11 +1,62 @@
 import pytest
 import sys
 from pathlib import Path
+from typing import Any, Callable
 
 sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
 
+from services.shared import fast_json
+from services.shared.parsers import parse_entity
+from services.shared.models.internal_representation.entity import Entity
+
+TEST_DATA_DIR = Path(__file__).parent.parent.parent / "test_data"
+
 
 @pytest.fixture(scope="session", autouse=True)
 def skip_api_waiter():
     """Override the API wait fixture from parent conftest"""
     pass
+
+
+@pytest.fixture(scope="session")
+def load_entity_json() -> Callable[[str], dict[str, Any]]:
+    """Loader for entity JSON files in test_data/entities, using orjson when available"""
+
+    def _load(filename: str) -> dict[str, Any]:
+        return fast_json.loads((TEST_DATA_DIR / "entities" / filename).read_bytes())
+
+    return _load
+
+
+@pytest.fixture(scope="session")
+def parsed_entity(load_entity_json) -> Callable[[str], Entity]:
+    """Parse an entity file from test_data/entities once per session, unwrapping the entities envelope"""
+    cache: dict[str, Entity] = {}
+
+    def _get(entity_id: str) -> Entity:
+        if entity_id not in cache:
+            entity_json = load_entity_json(f"{entity_id}.json")
+            if "entities" in entity_json:
+                entity_json = entity_json["entities"][entity_id]
+            cache[entity_id] = parse_entity(entity_json)
+        return cache[entity_id]
+
+    return _get
+
+
+@pytest.fixture(scope="session")
+def q42_entity(parsed_entity) -> Entity:
+    """Q42 parsed once per test session"""
+    return parsed_entity("Q42")
+
+
+@pytest.fixture(scope="session")
+def q17948861_entity(parsed_entity) -> Entity:
+    """Q17948861 parsed once per test session"""
+    return parsed_entity("Q17948861")
+
+
+@pytest.fixture(scope="session")
+def q120248304_entity(parsed_entity) -> Entity:
+    """Q120248304 parsed once per test session"""
+    return parsed_entity("Q120248304")
@@ -1,9 +1,22 @@
-import json
+import bz2
+import gzip
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 import pytest
 
-from services.shared.parsers import parse_entity
+from services.shared.parsers import entity_parser
+from services.shared.parsers import (
+    parse_entities_parallel,
+    parse_entity,
+    parse_entity_bytes,
+    parse_entity_cached,
+    parse_entity_dump,
+)
+from services.shared.models.internal_representation.entity import Entity
+from services.shared.models.internal_representation.ranks import Rank
+from services.shared.models.internal_representation.sitelinks import SitelinksTable
 
 TEST_DATA_DIR = Path(__file__).parent.parent.parent / "test_data"
 
@@ -35,14 +48,26 @@ def test_parse_entity_basic():
     assert entity.sitelinks is None
 
 
-def test_parse_q1_minimal():
+@pytest.mark.parametrize("entity_id,entity_type", [
+    ("Q1", "item"),
+    ("Q2", "item"),
+    ("Q3", "item"),
+    ("Q4", "item"),
+    ("Q5", "item"),
+    ("Q6", "item"),
+    ("Q10", "item"),
+    ("P2", "property"),
+])
+def test_parse_entity_file_id_and_type(parsed_entity, entity_id, entity_type):
+    """Test each flat entity file parses to the expected id and type"""
+    entity = parsed_entity(entity_id)
+    assert entity.id == entity_id
+    assert entity.type == entity_type
+
+
+def test_parse_q1_minimal(parsed_entity):
     """Test parsing minimal entity with only id and type"""
-    with open(TEST_DATA_DIR / "entities/Q1.json") as f:
-        entity_json = json.load(f)
-
-    entity = parse_entity(entity_json)
-    assert entity.id == "Q1"
-    assert entity.type == "item"
+    entity = parsed_entity("Q1")
     assert entity.labels == {}
     assert entity.descriptions == {}
     assert entity.aliases == {}
@@ -50,26 +75,127 @@ def test_parse_q1_minimal():
     assert entity.sitelinks is None
 
 
-def test_parse_q42():
-    """Test parsing Douglas Adams entity from real test data - uses wrapper format"""
-    with open(TEST_DATA_DIR / "entities/Q42.json") as f:
-        data = json.load(f)
+def test_parse_entity_bytes():
+    """Test parsing entity directly from raw JSON bytes"""
+    entity = parse_entity_bytes(b'{"id": "Q1", "type": "item", "labels": {"en": {"language": "en", "value": "Universe"}}}')
+    assert entity.id == "Q1"
+    assert entity.type == "item"
+    assert entity.labels == {"en": "Universe"}
 
-    entity_json = data["entities"]["Q42"]
-    entity = parse_entity(entity_json)
+
+def test_parse_entity_cached_reuses_identical_content():
+    """Test identical raw entity JSON is parsed once and served from the cache"""
+    entity_bytes = b'{"id": "Q7", "type": "item", "labels": {"en": {"language": "en", "value": "Cached"}}}'
+
+    first = parse_entity_cached(entity_bytes)
+    second = parse_entity_cached(bytes(entity_bytes))
+    assert first is second
+    assert second.labels == {"en": "Cached"}
+
+
+def test_parse_entity_fast_skips_malformed_statements():
+    """Test fast mode skips malformed statements like the defensive path instead of aborting the entity"""
+    entity_json = {
+        "id": "Q8",
+        "type": "item",
+        "claims": {
+            "P1": [{"rank": "normal"}],
+            "P2": [{"mainsnak": {"property": "P2"}, "rank": "normal"}],
+            "P3": [{
+                "mainsnak": {
+                    "snaktype": "value",
+                    "property": "P3",
+                    "datatype": "string",
+                    "datavalue": {"value": "kept", "type": "string"}
+                },
+                "rank": "normal"
+            }]
+        }
+    }
+
+    entity = parse_entity(entity_json, fast=True)
+    assert [statement.property for statement in entity.statements] == ["P3"]
+    assert entity == parse_entity(entity_json)
+
+
+@pytest.mark.parametrize("snak_json", [
+    {"snaktype": "value", "property": None, "datatype": "string", "datavalue": {"value": "x", "type": "string"}},
+    {"snaktype": "value", "property": "P1", "datatype": "monolingualtext",
+     "datavalue": {"value": {"text": "x", "language": None}, "type": "monolingualtext"}},
+    {"snaktype": "value", "property": "P1", "datatype": "wikibase-item",
+     "datavalue": {"value": {"id": None}, "type": "wikibase-entityid"}},
+])
+def test_parse_entity_skips_statements_with_null_strings(snak_json):
+    """Test JSON nulls in interned fields skip the statement instead of aborting the entity"""
+    entity = parse_entity({"id": "Q9", "type": "item", "claims": {"P1": [{"mainsnak": snak_json, "rank": "normal"}]}})
+    assert entity.statements == []
+
+
+def test_parse_entity_dump(tmp_path):
+    """Test streaming entities from a Wikidata-style array dump"""
+    dump_path = tmp_path / "dump.json"
+    dump_path.write_text(
+        "[\n"
+        '{"id": "Q1", "type": "item"},\n'
+        '{"id": "P2", "type": "property"}\n'
+        "]\n"
+    )
+
+    entities = list(parse_entity_dump(dump_path))
+    assert [entity.id for entity in entities] == ["Q1", "P2"]
+    assert entities[1].type == "property"
+
+
+@pytest.mark.parametrize("suffix,opener", [(".bz2", bz2.open), (".gz", gzip.open)])
+def test_parse_entity_dump_compressed(tmp_path, suffix, opener):
+    """Test streaming entities from a compressed Wikidata dump"""
+    dump_path = tmp_path / f"dump.json{suffix}"
+    with opener(dump_path, "wt") as dump_file:
+        dump_file.write('[\n{"id": "Q1", "type": "item"},\n{"id": "Q2", "type": "item"}\n]\n')
+
+    entities = list(parse_entity_dump(dump_path))
+    assert [entity.id for entity in entities] == ["Q1", "Q2"]
+
+
+def test_parse_entities_parallel():
+    """Test parsing flat entity files in worker processes keeps input order"""
+    entity_paths = [TEST_DATA_DIR / "entities" / f"{entity_id}.json" for entity_id in ("Q1", "Q2", "P2")]
+
+    entities = list(parse_entities_parallel(entity_paths, workers=2))
+    assert [entity.id for entity in entities] == ["Q1", "Q2", "P2"]
+    assert entities[1].labels["en"] == "Berlin"
+
+
+def test_parse_entities_parallel_cancels_queued_files_when_closed(monkeypatch):
+    """Test closing the generator early shuts the pool down with queued files cancelled"""
+    shutdowns = []
+
+    class RecordingExecutor(ProcessPoolExecutor):
+        def shutdown(self, wait=True, *, cancel_futures=False):
+            shutdowns.append(cancel_futures)
+            super().shutdown(wait=wait, cancel_futures=cancel_futures)
+
+    monkeypatch.setattr(entity_parser, "ProcessPoolExecutor", RecordingExecutor)
+    entity_paths = [TEST_DATA_DIR / "entities" / f"{entity_id}.json" for entity_id in ("Q1", "Q2", "P2")]
+
+    entities = parse_entities_parallel(entity_paths, workers=1)
+    assert next(entities).id == "Q1"
+    entities.close()
+    assert shutdowns == [True]
+
+
+def test_parse_q42(q42_entity):
+    """Test parsing Douglas Adams entity from real test data - uses wrapper format"""
+    entity = q42_entity
     assert entity.id == "Q42"
     assert entity.type == "item"
     assert len(entity.labels) > 0
     assert len(entity.statements) > 0
 
 
-def test_parse_q42_detailed():
+def test_parse_q42_detailed(q42_entity):
     """Test parsing Q42 with detailed verification of content - uses wrapper format"""
-    with open(TEST_DATA_DIR / "entities/Q42.json") as f:
-        data = json.load(f)
-
-    entity_json = data["entities"]["Q42"]
-    entity = parse_entity(entity_json)
+    entity = q42_entity
     assert entity.id == "Q42"
     assert entity.type == "item"
 
@@ -78,38 +204,26 @@ def test_parse_q42_detailed():
 
     assert len(entity.statements) > 300
 
-    p31_statements = [stmt for stmt in entity.statements if stmt.property == "P31"]
+    p31_statements = entity.statements_by_property.get("P31", [])
     assert len(p31_statements) > 0
     assert any(stmt.value.kind == "entity" for stmt in p31_statements)
 
-    ranks = [stmt.rank.value for stmt in entity.statements]
-    assert "normal" in ranks
-    assert "preferred" in ranks
+    assert {Rank.NORMAL, Rank.PREFERRED} <= entity.rank_set
 
     has_sitelinks = entity.sitelinks is not None and len(entity.sitelinks) > 0
     assert has_sitelinks
 
 
-def test_parse_p2():
+def test_parse_p2(parsed_entity):
     """Test parsing property entity from real test data"""
-    with open(TEST_DATA_DIR / "entities/P2.json") as f:
-        entity_json = json.load(f)
-
-    entity = parse_entity(entity_json)
-    assert entity.id == "P2"
-    assert entity.type == "property"
+    entity = parsed_entity("P2")
     assert len(entity.labels) > 0
     assert len(entity.statements) == 0
 
 
-def test_parse_q2_multilingual():
+def test_parse_q2_multilingual(parsed_entity):
     """Test parsing entity with multilingual labels, descriptions, and aliases"""
-    with open(TEST_DATA_DIR / "entities/Q2.json") as f:
-        entity_json = json.load(f)
-
-    entity = parse_entity(entity_json)
-    assert entity.id == "Q2"
-    assert entity.type == "item"
+    entity = parsed_entity("Q2")
     assert entity.labels == {"en": "Berlin", "ru": "Берлин"}
     assert entity.descriptions == {"en": "German city", "ru": "столица и одновременно земля Германии"}
     assert entity.aliases == {"en": ["Berlin, Germany", "Land Berlin"], "ru": ["Berlin"]}
@@ -117,26 +231,17 @@ def test_parse_q2_multilingual():
     assert entity.sitelinks is None
 
 
-def test_parse_q17948861():
+def test_parse_q17948861(q17948861_entity):
     """Test parsing entity with references from real test data - uses wrapper format"""
-    with open(TEST_DATA_DIR / "entities/Q17948861.json") as f:
-        data = json.load(f)
-
-    entity_json = data["entities"]["Q17948861"]
-    entity = parse_entity(entity_json)
+    entity = q17948861_entity
     assert entity.id == "Q17948861"
     assert entity.type == "item"
     assert len(entity.statements) > 0
 
 
-def test_parse_q3_sitelinks():
+def test_parse_q3_sitelinks(parsed_entity):
     """Test parsing entity with sitelinks without badges"""
-    with open(TEST_DATA_DIR / "entities/Q3.json") as f:
-        entity_json = json.load(f)
-
-    entity = parse_entity(entity_json)
-    assert entity.id == "Q3"
-    assert entity.type == "item"
+    entity = parsed_entity("Q3")
     assert entity.sitelinks is not None
     assert "enwiki" in entity.sitelinks
     assert entity.sitelinks["enwiki"]["site"] == "enwiki"
@@ -146,14 +251,9 @@ def test_parse_q3_sitelinks():
     assert entity.sitelinks["ruwiki"]["title"] == "Сан Франциско"
 
 
-def test_parse_q5_sitelinks_with_badges():
+def test_parse_q5_sitelinks_with_badges(parsed_entity):
     """Test parsing entity with sitelinks containing badges"""
-    with open(TEST_DATA_DIR / "entities/Q5.json") as f:
-        entity_json = json.load(f)
-
-    entity = parse_entity(entity_json)
-    assert entity.id == "Q5"
-    assert entity.type == "item"
+    entity = parsed_entity("Q5")
     assert entity.sitelinks is not None
     assert "enwiki" in entity.sitelinks
     assert entity.sitelinks["enwiki"]["badges"] == []
@@ -161,96 +261,88 @@ def test_parse_q5_sitelinks_with_badges():
     assert entity.sitelinks["ruwiki"]["badges"] == ["Q666", "Q42"]
 
 
-def test_parse_q4_complex_statements():
+def test_parse_q4_complex_statements(parsed_entity):
     """Test parsing entity with complex statements including novalue, somevalue, and deprecated rank"""
-    with open(TEST_DATA_DIR / "entities/Q4.json") as f:
-        entity_json = json.load(f)
-
-    entity = parse_entity(entity_json)
-    assert entity.id == "Q4"
-    assert entity.type == "item"
+    entity = parsed_entity("Q4")
     assert len(entity.statements) > 0
 
-    p2_statements = [stmt for stmt in entity.statements if stmt.property == "P2"]
+    p2_statements = entity.statements_by_property.get("P2", [])
     assert len(p2_statements) == 2
     assert any(stmt.rank.value == "preferred" for stmt in p2_statements)
 
-    p3_statements = [stmt for stmt in entity.statements if stmt.property == "P3"]
+    p3_statements = entity.statements_by_property.get("P3", [])
     assert len(p3_statements) == 2
     assert p3_statements[0].value.kind == "commons_media"
 
-    p4_statements = [stmt for stmt in entity.statements if stmt.property == "P4"]
+    p4_statements = entity.statements_by_property.get("P4", [])
     assert len(p4_statements) == 1
     assert p4_statements[0].value.kind == "globe"
 
-    p5_statements = [stmt for stmt in entity.statements if stmt.property == "P5"]
+    p5_statements = entity.statements_by_property.get("P5", [])
     assert len(p5_statements) == 3
     assert p5_statements[0].value.kind == "monolingual"
 
-    p9_statements = [stmt for stmt in entity.statements if stmt.property == "P9"]
+    p9_statements = entity.statements_by_property.get("P9", [])
     assert len(p9_statements) == 1
     assert p9_statements[0].value.kind == "url"
 
-    p10_statements = [stmt for stmt in entity.statements if stmt.property == "P10"]
+    p10_statements = entity.statements_by_property.get("P10", [])
     assert len(p10_statements) == 1
     assert p10_statements[0].value.kind == "geo_shape"
 
-    p11_statements = [stmt for stmt in entity.statements if stmt.property == "P11"]
+    p11_statements = entity.statements_by_property.get("P11", [])
     assert len(p11_statements) == 1
     assert p11_statements[0].value.kind == "external_id"
 
 
-def test_parse_q6_complex_qualifiers():
-    """Test parsing entity with complex qualifiers including multiple qualifiers per property"""
-    with open(TEST_DATA_DIR / "entities/Q6.json") as f:
-        entity_json = json.load(f)
+def test_statements_by_property_follows_statements(parsed_entity):
+    """Test the per-property index is rebuilt after a round-trip or a copy with new statements"""
+    entity = parsed_entity("Q4")
+    assert len(entity.statements_by_property["P2"]) == 2
 
-    entity = parse_entity(entity_json)
-    assert entity.id == "Q6"
-    assert entity.type == "item"
+    restored = Entity.model_validate(entity.model_dump())
+    assert len(restored.statements_by_property["P2"]) == 2
+    assert restored.rank_set == entity.rank_set
+    assert restored.references_by_property == entity.references_by_property
+
+    copied = entity.model_copy(update={"statements": entity.statements[:1]})
+    assert sum(len(statements) for statements in copied.statements_by_property.values()) == 1
 
-    p7_statements = [stmt for stmt in entity.statements if stmt.property == "P7"]
+
+def test_parse_q6_complex_qualifiers(parsed_entity):
+    """Test parsing entity with complex qualifiers including multiple qualifiers per property"""
+    entity = parsed_entity("Q6")
+
+    p7_statements = entity.statements_by_property.get("P7", [])
     assert len(p7_statements) == 1
 
 
     qualifiers = p7_statements[0].qualifiers
     assert len(qualifiers) == 13
 
-    p2_qualifiers = [q for q in qualifiers if q.property == "P2"]
-    assert len(p2_qualifiers) == 2
-    assert all(q.value.kind == "entity" for q in p2_qualifiers)
-
-    p3_qualifiers = [q for q in qualifiers if q.property == "P3"]
-    assert len(p3_qualifiers) == 2
-
-    p5_qualifiers = [q for q in qualifiers if q.property == "P5"]
-    assert len(p5_qualifiers) == 3
+    qualifiers_by_property = defaultdict(list)
+    for qualifier in qualifiers:
+        qualifiers_by_property[qualifier.property].append(qualifier)
 
-    p9_qualifiers = [q for q in qualifiers if q.property == "P9"]
-    assert len(p9_qualifiers) == 2
+    assert len(qualifiers_by_property["P2"]) == 2
+    assert all(q.value.kind == "entity" for q in qualifiers_by_property["P2"])
+    assert len(qualifiers_by_property["P3"]) == 2
+    assert len(qualifiers_by_property["P5"]) == 3
+    assert len(qualifiers_by_property["P9"]) == 2
 
 
-def test_parse_q10_simple():
+def test_parse_q10_simple(parsed_entity):
     """Test parsing simple entity with single statement and preferred rank"""
-    with open(TEST_DATA_DIR / "entities/Q10.json") as f:
-        entity_json = json.load(f)
-
-    entity = parse_entity(entity_json)
-    assert entity.id == "Q10"
-    assert entity.type == "item"
+    entity = parsed_entity("Q10")
 
     assert len(entity.statements) == 1
     assert entity.statements[0].property == "P2"
     assert entity.statements[0].rank.value == "preferred"
 
 
-def test_parse_q120248304():
+def test_parse_q120248304(q120248304_entity):
     """Test parsing another real Wikidata entity"""
-    with open(TEST_DATA_DIR / "entities/Q120248304.json") as f:
-        data = json.load(f)
-
-    entity_json = data["entities"]["Q120248304"]
-    entity = parse_entity(entity_json)
+    entity = q120248304_entity
     assert entity.id == "Q120248304"
     assert entity.type == "item"
     assert len(entity.statements) > 0
@@ -280,3 +372,37 @@ def test_parse_entity_with_sitelinks():
     assert entity.sitelinks is not None
     assert "enwiki" in entity.sitelinks
     assert entity.sitelinks["enwiki"]["site"] == "enwiki"
+
+
+def test_sitelinks_keep_json_dict_shape(q42_entity):
+    """Test sitelinks iterate, dump and validate as the site-keyed dict from entity JSON"""
+    sitelinks = q42_entity.sitelinks
+    assert list(sitelinks) == list(sitelinks.keys())
+    assert dict(sitelinks.items())["enwiki"]["title"] == "Douglas Adams"
+    assert sitelinks.get("nosuchwiki") is None
+
+    dumped = q42_entity.model_dump()
+    assert dumped["sitelinks"]["enwiki"] == {
+        "site": "enwiki",
+        "title": "Douglas Adams",
+        "badges": [],
+        "url": "https://en.wikipedia.org/wiki/Douglas_Adams"
+    }
+    assert Entity.model_validate(dumped).sitelinks == q42_entity.sitelinks
+
+    entity = Entity(
+        id="Q3", type="item", labels={}, descriptions={}, aliases={}, statements=[],
+        sitelinks={"enwiki": {"site": "enwiki", "title": "Test", "badges": []}}
+    )
+    assert entity.sitelinks == {"enwiki": {"site": "enwiki", "title": "Test", "badges": []}}
+
+
+
+def test_sitelinks_copy_rebuilds_site_index():
+    """Test model_copy with new sites keeps lookups in step with the copied sites"""
+    sitelinks = SitelinksTable(sites=["enwiki"], titles=["Test"], badges=[[]], urls=[None])
+    copied = sitelinks.model_copy(update={"sites": ["dewiki"]})
+    assert list(copied) == ["dewiki"]
+    assert "dewiki" in copied
+    assert "enwiki" not in copied
+    assert copied["dewiki"]["title"] == "Test"
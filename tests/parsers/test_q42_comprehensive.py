@@ -1,23 +1,13 @@
-import json
-from pathlib import Path
-
 import pytest
 
-from services.shared.parsers import parse_entity
 from services.shared.models.internal_representation.entity_types import EntityKind
 from services.shared.models.internal_representation.ranks import Rank
 from services.shared.models.internal_representation.value_kinds import ValueKind
 
-TEST_DATA_DIR = Path(__file__).parent.parent.parent / "test_data"
-
 
-def test_parse_q42_comprehensive():
+def test_parse_q42_comprehensive(q42_entity):
     """Test comprehensive parsing of Q42.json (Douglas Adams entity)"""
-    with open(TEST_DATA_DIR / "entities/Q42.json") as f:
-        data = json.load(f)
-
-    entity_json = data["entities"]["Q42"]
-    entity = parse_entity(entity_json)
+    entity = q42_entity
 
     assert entity.id == "Q42"
     assert entity.type == EntityKind.ITEM
@@ -42,36 +32,36 @@ def test_parse_q42_comprehensive():
     unique_properties = len(set(stmt.property for stmt in entity.statements))
     assert unique_properties == 293
 
-    p31_statements = [stmt for stmt in entity.statements if stmt.property == "P31"]
+    p31_statements = entity.statements_by_property.get("P31", [])
     assert len(p31_statements) > 0
     assert p31_statements[0].value.kind == ValueKind.ENTITY
     assert p31_statements[0].value.value == "Q5"
 
-    p569_statements = [stmt for stmt in entity.statements if stmt.property == "P569"]
+    p569_statements = entity.statements_by_property.get("P569", [])
     assert len(p569_statements) > 0
     assert p569_statements[0].value.kind == ValueKind.TIME
     assert p569_statements[0].value.value == "+1952-03-11T00:00:00Z"
     assert p569_statements[0].value.precision == 11
 
-    p570_statements = [stmt for stmt in entity.statements if stmt.property == "P570"]
+    p570_statements = entity.statements_by_property.get("P570", [])
     assert len(p570_statements) > 0
     assert p570_statements[0].value.kind == ValueKind.TIME
     assert p570_statements[0].value.value == "+2001-05-11T00:00:00Z"
 
-    p106_statements = [stmt for stmt in entity.statements if stmt.property == "P106"]
+    p106_statements = entity.statements_by_property.get("P106", [])
     assert len(p106_statements) > 1
-    occupation_ids = [stmt.value.value for stmt in p106_statements if stmt.value.kind == ValueKind.ENTITY]
-    assert len(occupation_ids) > 0
+    assert any(stmt.value.kind == ValueKind.ENTITY for stmt in p106_statements)
+
+    assert {Rank.NORMAL, Rank.PREFERRED} <= entity.rank_set
 
-    ranks = [stmt.rank for stmt in entity.statements]
-    assert Rank.NORMAL in ranks
-    assert Rank.PREFERRED in ranks
+    assert any(stmt.qualifiers for stmt in entity.statements)
 
-    statements_with_qualifiers = [stmt for stmt in entity.statements if stmt.qualifiers]
-    assert len(statements_with_qualifiers) > 0
+    assert any(stmt.references for stmt in entity.statements)
 
-    statements_with_references = [stmt for stmt in entity.statements if stmt.references]
-    assert len(statements_with_references) > 0
+    stated_in = entity.references_by_property.get("P248", [])
+    assert len(stated_in) > 0
+    for statement_index, reference_index in stated_in:
+        assert "P248" in entity.statements[statement_index].references[reference_index].properties
 
     assert entity.sitelinks is not None
     assert len(entity.sitelinks) == 129
@@ -79,3 +79,16 @@ def test_parse_qualifier_with_somevalue():
     qualifier = parse_qualifier(qualifier_json)
     assert qualifier.property == "P3"
     assert qualifier.value.kind == "somevalue"
+
+
+def test_parse_qualifier_fast_matches_default():
+    """Test parse_qualifier gives the same result with fast=True, including snaks without a datavalue"""
+    qualifier_json = {
+        "snaktype": "value",
+        "property": "P2",
+        "datatype": "string",
+        "datavalue": {"value": "abc", "type": "string"}
+    }
+
+    assert parse_qualifier(qualifier_json, fast=True) == parse_qualifier(qualifier_json)
+    assert parse_qualifier({"snaktype": "novalue", "property": "P2"}, fast=True).value.kind == "novalue"
@@ -1,6 +1,8 @@
 import pytest
 
 from services.shared.parsers import parse_reference
+from services.shared.models.internal_representation.references import Reference, ReferenceValue
+from services.shared.models.internal_representation.values import StringValue
 
 
 def test_parse_reference_with_novalue():
@@ -39,3 +41,40 @@ def test_parse_reference_with_somevalue():
     assert len(reference.snaks) == 1
     assert reference.snaks[0].property == "P3"
     assert reference.snaks[0].value.kind == "somevalue"
+
+
+def test_reference_snaks_are_cached():
+    """Test Reference.snaks is built once and reused across accesses"""
+    reference = parse_reference({"snaks": {"P2": [{"snaktype": "novalue", "property": "P2"}]}})
+    assert reference.snaks is reference.snaks
+
+
+def test_parse_reference_fast_matches_default():
+    """Test parse_reference gives the same result with fast=True"""
+    reference_json = {
+        "hash": "abc",
+        "snaks": {
+            "P854": [
+                {
+                    "snaktype": "value",
+                    "property": "P854",
+                    "datatype": "url",
+                    "datavalue": {"value": "https://example.org", "type": "string"}
+                }
+            ]
+        }
+    }
+
+    assert parse_reference(reference_json, fast=True) == parse_reference(reference_json)
+
+
+def test_reference_keeps_snaks_shape():
+    """Test Reference validates from and dumps to the hash plus snaks shape"""
+    reference = Reference(hash="abc", snaks=[ReferenceValue(property="P854", value=StringValue(value="x"))])
+    assert reference.properties == ("P854",)
+
+    dumped = reference.model_dump()
+    assert set(dumped) == {"hash", "snaks"}
+    assert dumped["snaks"][0]["property"] == "P854"
+    assert dumped["snaks"][0]["value"]["value"] == "x"
+    assert Reference.model_validate(dumped).model_dump() == dumped
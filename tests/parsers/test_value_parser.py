@@ -1,6 +1,8 @@
 import pytest
 
 from services.shared.parsers import parse_value
+from services.shared.parsers.value_parser import _intern_value
+from services.shared.parsers.values.entity_value_parser import parse_entity_value
 
 
 def test_parse_entity_value():
@@ -21,6 +23,21 @@ def test_parse_entity_value():
     assert value.datatype_uri == "http://wikiba.se/ontology#WikibaseItem"
 
 
+def test_intern_value_reuses_instance():
+    """Test the value interner parses an identical datavalue once and returns the cached instance"""
+    calls = []
+
+    def parser(datavalue):
+        calls.append(datavalue)
+        return parse_entity_value(datavalue)
+
+    first = _intern_value(parser, {"value": {"id": "Q424242"}, "type": "wikibase-entityid"})
+    second = _intern_value(parser, {"value": {"id": "Q424242"}, "type": "wikibase-entityid"})
+    assert first is second
+    assert second.value == "Q424242"
+    assert len(calls) == 1
+
+
 def test_parse_string_value():
     """Test parsing string value"""
     snak_json = {
@@ -65,6 +82,46 @@ def test_parse_time_value():
     assert value.precision == 11
 
 
+def test_parse_time_value_with_missing_fields():
+    """Test parsing time value falls back to defaults for absent fields"""
+    snak_json = {
+        "snaktype": "value",
+        "property": "P5",
+        "datatype": "time",
+        "datavalue": {
+            "value": {
+                "time": "+2023-12-31T00:00:00Z"
+            },
+            "type": "time"
+        }
+    }
+
+    value = parse_value(snak_json)
+    assert value.value == "+2023-12-31T00:00:00Z"
+    assert value.timezone == 0
+    assert value.precision == 11
+    assert value.calendarmodel == "http://www.wikidata.org/entity/Q1985727"
+
+
+def test_parse_identical_time_values_share_instance():
+    """Test identical time datavalues on different snaks resolve to one Value instance"""
+    datavalue = {
+        "value": {
+            "time": "+1952-03-11T00:00:00Z",
+            "timezone": 0,
+            "before": 0,
+            "after": 0,
+            "precision": 11,
+            "calendarmodel": "http://www.wikidata.org/entity/Q1985727"
+        },
+        "type": "time"
+    }
+
+    first = parse_value({"snaktype": "value", "property": "P569", "datatype": "time", "datavalue": datavalue})
+    second = parse_value({"snaktype": "value", "property": "P585", "datatype": "time", "datavalue": dict(datavalue)})
+    assert first is second
+
+
 def test_parse_quantity_value():
     """Test parsing quantity value"""
     snak_json = {
@@ -114,6 +171,26 @@ def test_parse_globe_value():
     assert value.longitude == 12.125
 
 
+@pytest.mark.parametrize("datatype,entity_id", [
+    ("wikibase-item", "Q5"),
+    ("wikibase-property", "P31"),
+])
+def test_parse_entity_datatypes_dispatch_directly(datatype, entity_id):
+    """Test entity datatypes resolve without the datavalue type fallback"""
+    snak_json = {
+        "snaktype": "value",
+        "property": "P1",
+        "datatype": datatype,
+        "datavalue": {
+            "value": {"id": entity_id}
+        }
+    }
+
+    value = parse_value(snak_json)
+    assert value.kind == "entity"
+    assert value.value == entity_id
+
+
 def test_parse_monolingual_value():
     """Test parsing monolingual text value"""
     snak_json = {
@@ -135,140 +212,31 @@ def test_parse_monolingual_value():
     assert value.text == "Douglas Adams"
 
 
-def test_parse_external_id_value():
-    """Test parsing external ID value"""
+@pytest.mark.parametrize("datatype,raw_value,kind", [
+    ("external-id", "12345", "external_id"),
+    ("commonsMedia", "Example.jpg", "commons_media"),
+    ("geo-shape", "Data:Example.map", "geo_shape"),
+    ("tabular-data", "Data:Example.tab", "tabular_data"),
+    ("musical-notation", "\\relative c' { c d e f }", "musical_notation"),
+    ("url", "https://example.com", "url"),
+    ("math", "E = mc^2", "math"),
+    ("entity-schema", "S1234", "entity_schema"),
+])
+def test_parse_string_datatype_value(datatype, raw_value, kind):
+    """Test parsing string-valued datatypes into their value kinds"""
     snak_json = {
         "snaktype": "value",
         "property": "P9",
-        "datatype": "external-id",
-        "datavalue": {
-            "value": "12345",
-            "type": "string"
-        }
-    }
-
-    value = parse_value(snak_json)
-    assert value.kind == "external_id"
-    assert value.value == "12345"
-
-
-def test_parse_commons_media_value():
-    """Test parsing commons media value"""
-    snak_json = {
-        "snaktype": "value",
-        "property": "P10",
-        "datatype": "commonsMedia",
-        "datavalue": {
-            "value": "Example.jpg",
-            "type": "string"
-        }
-    }
-
-    value = parse_value(snak_json)
-    assert value.kind == "commons_media"
-    assert value.value == "Example.jpg"
-
-
-def test_parse_geo_shape_value():
-    """Test parsing geo shape value"""
-    snak_json = {
-        "snaktype": "value",
-        "property": "P11",
-        "datatype": "geo-shape",
-        "datavalue": {
-            "value": "Data:Example.map",
-            "type": "string"
-        }
-    }
-
-    value = parse_value(snak_json)
-    assert value.kind == "geo_shape"
-    assert value.value == "Data:Example.map"
-
-
-def test_parse_tabular_data_value():
-    """Test parsing tabular data value"""
-    snak_json = {
-        "snaktype": "value",
-        "property": "P12",
-        "datatype": "tabular-data",
-        "datavalue": {
-            "value": "Data:Example.tab",
-            "type": "string"
-        }
-    }
-
-    value = parse_value(snak_json)
-    assert value.kind == "tabular_data"
-    assert value.value == "Data:Example.tab"
-
-
-def test_parse_musical_notation_value():
-    """Test parsing musical notation value"""
-    snak_json = {
-        "snaktype": "value",
-        "property": "P13",
-        "datatype": "musical-notation",
-        "datavalue": {
-            "value": "\\relative c' { c d e f }",
-            "type": "string"
-        }
-    }
-
-    value = parse_value(snak_json)
-    assert value.kind == "musical_notation"
-    assert value.value == "\\relative c' { c d e f }"
-
-
-def test_parse_url_value():
-    """Test parsing URL value"""
-    snak_json = {
-        "snaktype": "value",
-        "property": "P14",
-        "datatype": "url",
-        "datavalue": {
-            "value": "https://example.com",
-            "type": "string"
-        }
-    }
-
-    value = parse_value(snak_json)
-    assert value.kind == "url"
-    assert value.value == "https://example.com"
-
-
-def test_parse_math_value():
-    """Test parsing math value"""
-    snak_json = {
-        "snaktype": "value",
-        "property": "P15",
-        "datatype": "math",
-        "datavalue": {
-            "value": "E = mc^2",
-            "type": "string"
-        }
-    }
-
-    value = parse_value(snak_json)
-    assert value.kind == "math"
-    assert value.value == "E = mc^2"
-
-
-def test_parse_entity_schema_value():
-    """Test parsing entity schema value"""
-    snak_json = {
-        "snaktype": "value",
-        "property": "P16",
-        "datatype": "entity-schema",
+        "datatype": datatype,
         "datavalue": {
-            "value": "S1234",
+            "value": raw_value,
             "type": "string"
         }
     }
 
     value = parse_value(snak_json)
-    assert value.kind == "entity_schema"
-    assert value.value == "S1234"
+    assert value.kind == kind
+    assert value.value == raw_value
 
 
 def test_parse_novalue_value():
@@ -323,4 +291,24 @@ def test_parse_unsupported_datatype():
     }
 
     with pytest.raises(ValueError, match="Unsupported value type"):
-        parse_value(snak_json)
+        parse_value(snak_json, fast=False)
+
+
+@pytest.mark.parametrize("snak_json,kind", [
+    ({"snaktype": "value", "property": "P1", "datatype": "string", "datavalue": {"value": "fast", "type": "string"}}, "string"),
+    ({"snaktype": "value", "property": "P1", "datatype": "wikibase-lexeme", "datavalue": {"value": {"id": "L1"}, "type": "wikibase-entityid"}}, "entity"),
+    ({"snaktype": "novalue", "property": "P1"}, "novalue"),
+])
+def test_parse_value_fast_mode(snak_json, kind):
+    """Test fast mode matches the defensive path, including its datavalue type fallback"""
+    value = parse_value(snak_json, fast=True)
+    assert value.kind == kind
+    assert value == parse_value(snak_json)
+
+
+def test_intern_value_keys_on_resolved_parser():
+    """Test snaks without a datatype keep their datavalue type when the raw value is the same"""
+    string_value = parse_value({"snaktype": "value", "datavalue": {"value": "https://e.org", "type": "string"}})
+    url_value = parse_value({"snaktype": "value", "datavalue": {"value": "https://e.org", "type": "url"}})
+    assert string_value.kind == "string"
+    assert url_value.kind == "url"
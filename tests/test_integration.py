@@ -236,11 +236,10 @@ def test_raw_endpoint_existing_revision(api_client: requests.Session, base_url:
     
     # Log response body if enabled
     import os
-    if os.getenv("TEST_LOG_HTTP_REQUESTS") == "true":
-        logger.debug(f"  ← ✓ 200 OK")
+    if os.getenv("TEST_LOG_HTTP_REQUESTS") == "true" and logger.isEnabledFor(logging.DEBUG):
+        logger.debug("  ← ✓ 200 OK")
         if response.text:
-            text_preview = response.text[:200]
-            logger.debug(f"    Body: {text_preview}...")
+            logger.debug("    Body: %.200s...", response.text)
     
     logger.info("✓ Raw endpoint returns full revision schema with content_hash")
 